@@ -0,0 +1,347 @@
+####################################################################################
+#
+# Distributed under MIT Licence
+#   See https://github.com/house-of-abbey/GarminHomeAssistant/blob/main/LICENSE
+#
+####################################################################################
+#
+# GarminHomeAssistant is a Garmin IQ application written in Monkey C and routinely
+# tested on a Venu 2 device. The source code is provided at:
+#            https://github.com/house-of-abbey/GarminHomeAssistant
+#
+# J D Abbey & P A Abbey, 19 October 2026
+#
+#
+# Description:
+#
+# Python script to compile the application for each device separately, in
+# parallel, on any platform with Java and the Connect IQ SDK installed. This is
+# the Linux equivalent of 'compile_sim.cmd' for one or many devices.
+#
+# The products are read from 'manifest.xml' and each product's resource paths
+# from 'monkey.jungle'. The inputs for a device are the source files, the
+# manifest, the 'monkey.jungle' settings other than the product resource paths,
+# the default and language resources, and the device's own resource paths. A
+# digest of these inputs is kept for each device, together with the resolved
+# compiler command, the SDK's compiler and the developer key, so that only devices
+# whose inputs have changed since their last successful build are compiled.
+#
+# The compiler command is a template so that another compiler can be used, e.g.
+# for testing the script. The following fields are substituted in each argument:
+#   {device}  Product ID from 'manifest.xml'
+#   {output}  Path of the PRG file to create
+#   {jungle}  Path of 'monkey.jungle'
+#   {key}     Path of the developer key
+#   {sdk}     Connect IQ SDK directory
+#
+# Usage:
+#   python buildDevices.py [-d DEVICES] [-j JOBS] [-f] [-n] [--compiler TEMPLATE]
+#
+# Python installation:
+#   No additional packages required.
+#
+# References:
+#  * Using Monkey C from the Command Line
+#    https://developer.garmin.com/connect-iq/reference-guides/monkey-c-command-line-setup/
+#
+####################################################################################
+
+import os
+import re
+import sys
+import json
+import shlex
+import hashlib
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from lintResources import read_manifest, read_jungle, manifest_file, jungle_file, english_dir
+
+# ---------------- Configuration ----------------
+
+source_dir  = "source"
+output_dir  = os.path.join("bin", "devices")
+cache_file  = os.path.join(output_dir, ".buildDevices.json")
+private_key = os.path.join("..", "developer_key")
+
+# Each compiler is a separate JVM, so do not default to one per core
+default_jobs = min(os.cpu_count() or 1, 4)
+
+# As used by compile_sim.cmd and export.cmd, less the 1 GB initial heap as several
+# compilers run at once
+default_compiler = (
+    "java -Dfile.encoding=UTF-8 -Dapple.awt.UIElement=true"
+    " -jar {sdk}/bin/monkeybrains.jar"
+    " --output {output} --jungles {jungle} --private-key {key} --device {device} --warn"
+)
+
+# ---------------- Inputs ----------------
+
+def find_sdk() -> str:
+    """
+    Find the current Connect IQ SDK as selected by the SDK manager.
+
+    :return: SDK directory, or an empty string if it cannot be found.
+    """
+    for cfg in [
+        os.path.expanduser(os.path.join("~", ".Garmin", "ConnectIQ", "current-sdk.cfg")),
+        os.path.join(os.environ.get("APPDATA", ""), "Garmin", "ConnectIQ", "current-sdk.cfg"),
+    ]:
+        if os.path.isfile(cfg):
+            with open(cfg, "r", encoding="utf-8") as f:
+                return f.read().strip().rstrip("/\\")
+    return ""
+
+def list_files(path: str) -> List[str]:
+    """
+    List all the files beneath a directory, or the path itself if it is a file.
+    """
+    if os.path.isfile(path):
+        return [path]
+    files = []
+    for dirpath, _dirs, names in os.walk(path):
+        files.extend(os.path.join(dirpath, n) for n in names)
+    return files
+
+def read_jungle_common(path: str = jungle_file) -> List[str]:
+    """
+    Read the settings in a jungle file that apply to every product, i.e. all but
+    the per-product 'resourcePath' assignments, ignoring comments and blank lines.
+
+    :param path: Path to 'monkey.jungle'.
+    :return: List of settings in file order.
+    """
+    common = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line and not re.match(r"^[\w-]+\.resourcePath\s*=", line):
+                common.append(line)
+    return common
+
+def device_inputs(
+    device: str,
+    languages: List[str],
+    jungle: Dict[str, List[str]],
+) -> List[str]:
+    """
+    Resolve the files a device's build depends on.
+
+    :param device: Product ID.
+    :param languages: Language codes from 'manifest.xml'.
+    :param jungle: Resource paths per product, see read_jungle().
+    :return: Sorted list of file paths.
+    """
+    # 'monkey.jungle' is keyed by its contents for this device, see device_digests()
+    paths = [manifest_file, source_dir, english_dir]
+    paths += [f"{english_dir}-{lang}" for lang in languages]
+    paths += jungle.get(device, [])
+    files = set()
+    for p in paths:
+        files.update(list_files(p))
+    return sorted(f for f in files if f.endswith((".mc", ".xml", ".svg", ".png")))
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+def device_digests(
+    devices: List[str],
+    languages: List[str],
+    jungle: Dict[str, List[str]],
+    command: List[str],
+    fields: Dict[str, str],
+    jobs: Optional[int] = None,
+) -> Dict[str, str]:
+    """
+    Compute the cache key for each device from its resolved inputs, its own
+    'monkey.jungle' settings, the compiler command as run for the device, the
+    SDK's 'monkeybrains.jar' and the developer key, so that editing another
+    device's resource paths does not rebuild this one but changing SDK does.
+    Each file is only read once, however many devices use it.
+
+    :param command: Compiler command template, one item per argument.
+    :param fields: Values for the fields common to all devices, see compile_device().
+    :return: Dictionary of device to digest.
+    """
+    inputs = {d: device_inputs(d, languages, jungle) for d in devices}
+    # A missing tool file is keyed by its absence, so creating it forces a rebuild
+    tools = [fields["key"]]
+    if fields["sdk"]:
+        tools.append(os.path.join(fields["sdk"], "bin", "monkeybrains.jar"))
+    tools = [t for t in tools if os.path.isfile(t)]
+    all_files = sorted(set(f for files in inputs.values() for f in files) | set(tools))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        file_digests = dict(zip(all_files, pool.map(file_digest, all_files)))
+    tool_digests = {t: file_digests[t] for t in tools}
+
+    common = read_jungle_common()
+    digests = {}
+    for d, files in inputs.items():
+        values = dict(fields, device=d, output=output_path(d))
+        h = hashlib.sha256()
+        h.update(json.dumps([a.format(**values) for a in command]).encode("utf-8"))
+        h.update(json.dumps(tool_digests, sort_keys=True).encode("utf-8"))
+        h.update(json.dumps([common, jungle.get(d, [])]).encode("utf-8"))
+        for f in files:
+            h.update(f"{f.replace(os.sep, '/')}\0{file_digests[f]}\n".encode("utf-8"))
+        digests[d] = h.hexdigest()
+    return digests
+
+# ---------------- Cache ----------------
+
+def load_cache(path: str = cache_file) -> Dict[str, str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache: Dict[str, str], path: str = cache_file) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+# ---------------- Build ----------------
+
+def output_path(device: str) -> str:
+    return os.path.join(output_dir, f"HomeAssistant-{device}.prg")
+
+def compile_device(device: str, command: List[str], fields: Dict[str, str]) -> Tuple[bool, str]:
+    """
+    Run the compiler for one device.
+
+    :param device: Product ID.
+    :param command: Compiler command template, one item per argument.
+    :param fields: Values for the fields common to all devices.
+    :return: Tuple of (success, compiler output).
+    """
+    values = dict(fields, device=device, output=output_path(device))
+    args = [a.format(**values) for a in command]
+    # Do not mistake an old output for the result of this build
+    if os.path.exists(values["output"]):
+        os.remove(values["output"])
+    try:
+        result = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    except OSError as e:
+        return False, str(e)
+    ok = result.returncode == 0 and os.path.exists(values["output"])
+    return ok, result.stdout
+
+def select_devices(spec: Optional[str], products: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Parse a comma or whitespace separated list of products, '*' or 'all'.
+
+    :return: Tuple of (selected products in manifest order, unknown selectors).
+    """
+    if not spec:
+        return products, []
+    tokens = [t for t in re.split(r"[,\s]+", spec.strip().lower()) if t]
+    if any(t in ("*", "all") for t in tokens):
+        return products, []
+    unknown = sorted(set(tokens) - set(products))
+    return [p for p in products if p in tokens], unknown
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the Garmin IQ application per device, in parallel.")
+    parser.add_argument(
+        "-d", "--devices",
+        type=str,
+        default=None,
+        help="Limit the devices built. Accepts comma/space separated product IDs from manifest.xml "
+             "(e.g., 'venu2, fr955'). Use '*' or 'all' for all (default)."
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=default_jobs,
+        help=f"Number of compilers to run at once (default {default_jobs})"
+    )
+    parser.add_argument(
+        "-f", "--force",
+        action="store_true",
+        help="Ignore the cache and compile every selected device"
+    )
+    parser.add_argument(
+        "-n", "--dry-run",
+        action="store_true",
+        help="List the devices that would be compiled without compiling them"
+    )
+    parser.add_argument(
+        "--compiler",
+        type=str,
+        default=default_compiler,
+        help="Compiler command template, with {device}, {output}, {jungle}, {key} and {sdk} fields"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print the compiler output for successful builds too"
+    )
+    args = parser.parse_args()
+
+    # Paths are relative to this script's directory, as for the other scripts
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    products, languages = read_manifest()
+    jungle = read_jungle()
+    devices, unknown = select_devices(args.devices, products)
+    if unknown:
+        print(f"Warning: unknown devices ignored: {', '.join(unknown)}")
+    if not devices:
+        print("No valid devices selected. Nothing to do.")
+        sys.exit(0)
+
+    command = shlex.split(args.compiler)
+    fields = {
+        "jungle": jungle_file,
+        "key"   : private_key,
+        "sdk"   : find_sdk(),
+    }
+    digests = device_digests(devices, languages, jungle, command, fields, args.jobs)
+    cache = load_cache()
+    todo = [
+        d for d in devices
+        if args.force or cache.get(d) != digests[d] or not os.path.exists(output_path(d))
+    ]
+    print(f"{len(todo)} of {len(devices)} devices need compiling.")
+    if args.dry_run:
+        for d in todo:
+            print(f"  {d}")
+        return
+    if not todo:
+        return
+    if "{sdk}" in args.compiler and not fields["sdk"]:
+        print("Connect IQ SDK not found: no current-sdk.cfg from the SDK manager. "
+              "Install an SDK or use --compiler without the {sdk} field.")
+        sys.exit(1)
+
+    os.makedirs(output_dir, exist_ok=True)
+    failed = []
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {pool.submit(compile_device, d, command, fields): d for d in todo}
+        for i, future in enumerate(as_completed(futures), start=1):
+            d = futures[future]
+            ok, out = future.result()
+            if ok:
+                print(f"{i} of {len(todo)}: Compiled {d}")
+                # Saved after each device so an interrupted run keeps its progress
+                cache[d] = digests[d]
+                save_cache(cache)
+            else:
+                print(f"{i} of {len(todo)}: Failed to compile {d}")
+                cache.pop(d, None)
+                failed.append(d)
+            if out and (args.verbose or not ok):
+                print(out.rstrip())
+
+    if failed:
+        print(f"Failed devices: {', '.join(sorted(failed))}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
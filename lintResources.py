@@ -0,0 +1,400 @@
+####################################################################################
+#
+# Distributed under MIT Licence
+#   See https://github.com/house-of-abbey/GarminHomeAssistant/blob/main/LICENSE
+#
+####################################################################################
+#
+# GarminHomeAssistant is a Garmin IQ application written in Monkey C and routinely
+# tested on a Venu 2 device. The source code is provided at:
+#            https://github.com/house-of-abbey/GarminHomeAssistant
+#
+# J D Abbey & P A Abbey, 19 October 2026
+#
+#
+# Description:
+#
+# Python script to check the resources before starting a slow Connect IQ compile.
+# All 'resources*' directories, 'monkey.jungle' and 'manifest.xml' are checked in
+# one pass for:
+#  * XML files that do not parse,
+#  * string IDs missing from a language, or not present in the English source,
+#  * duplicate string IDs,
+#  * 'scope' attributes that differ from the English source,
+#  * '@Strings' references in the settings and manifest with no English string,
+#  * drawables referring to missing files, or icon directories that do not
+#    define the same drawables as their source directory,
+#  * 'monkey.jungle' resource paths that do not exist, or name unknown products,
+#  * manifest products with no 'resourcePath' in 'monkey.jungle',
+#  * manifest languages with no 'resources-XXX' directory.
+#
+# XML files are parsed in parallel and the facts extracted from each are kept in
+# an index file, so that unchanged files are not parsed again on the next run.
+# The Python standard library XML parser is used rather than BeautifulSoup as it
+# reports broken XML instead of repairing it.
+#
+# Usage:
+#   python lintResources.py [-j JOBS] [--no-cache]
+#
+# Python installation:
+#   No additional packages required.
+#
+####################################################################################
+
+import os
+import re
+import sys
+import json
+import argparse
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# ---------------- Configuration ----------------
+
+manifest_file = "manifest.xml"
+jungle_file   = "monkey.jungle"
+english_dir   = "resources"
+index_file    = ".lintResources.json"
+
+# Increment when the facts stored in the index change shape
+index_version = 1
+
+# Icon directories are generated from these by iconResize.py and
+# launcherIconResize.py, so they must all define the same drawables.
+icon_sources: Dict[str, str] = {
+    "resources-icons-"   : "resources-icons-48",
+    "resources-launcher-": "resources-launcher-70-70",
+}
+
+iq_ns = {"iq": "http://www.garmin.com/xml/connectiq"}
+
+# ---------------- Parsing ----------------
+
+def read_manifest(path: str = manifest_file) -> Tuple[List[str], List[str]]:
+    """
+    Read the product and language lists from the application manifest.
+
+    :param path: Path to 'manifest.xml'.
+    :return: Tuple of (product IDs, language codes) in manifest order.
+    """
+    root = ET.parse(path).getroot()
+    products  = [p.get("id") for p in root.iterfind(".//iq:products/iq:product", iq_ns)]
+    languages = [l.text.strip() for l in root.iterfind(".//iq:languages/iq:language", iq_ns) if l.text]
+    return products, languages
+
+def read_jungle(path: str = jungle_file) -> Dict[str, List[str]]:
+    """
+    Read the per-product resource paths from a jungle file. Only assignments of
+    the form '<product>.resourcePath = $(<product>.resourcePath);a;b' are used,
+    and the '$(...)' references to the default path are dropped.
+
+    :param path: Path to 'monkey.jungle'.
+    :return: Dictionary of product ID to the list of additional resource paths.
+    """
+    paths: Dict[str, List[str]] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            m = re.match(r"^([\w-]+)\.resourcePath\s*=\s*(.*)$", line)
+            if not m:
+                continue
+            entries = [e.strip() for e in m.group(2).split(";")]
+            paths.setdefault(m.group(1), []).extend(
+                e for e in entries if e and not e.startswith("$(")
+            )
+    return paths
+
+def scan_xml(path: str) -> Dict:
+    """
+    Parse a resource XML file and extract the facts needed by the checks. The
+    result only contains JSON serialisable values so it can be stored in the index.
+
+    :param path: Path to the XML file.
+    :return: Dictionary of facts, with 'error' set if the file does not parse.
+    """
+    facts = {
+        "error"     : None,
+        "strings"   : {},
+        "scopes"    : {},
+        "duplicates": [],
+        "bitmaps"   : {},
+        "refs"      : [],
+    }
+    try:
+        root = ET.parse(path).getroot()
+    except (ET.ParseError, OSError) as e:
+        facts["error"] = str(e)
+        return facts
+
+    for s in root.iter("string"):
+        sid = s.get("id")
+        if not sid:
+            continue
+        if sid in facts["strings"]:
+            facts["duplicates"].append(sid)
+        facts["strings"][sid] = "".join(s.itertext())
+        if s.get("scope") is not None:
+            facts["scopes"][sid] = s.get("scope")
+    for b in root.iter("bitmap"):
+        if b.get("id"):
+            facts["bitmaps"][b.get("id")] = b.get("filename")
+    refs = set()
+    for e in root.iter():
+        for v in list(e.attrib.values()) + [e.text or ""]:
+            refs.update(re.findall(r"@Strings\.(\w+)", v))
+    facts["refs"] = sorted(refs)
+    return facts
+
+# ---------------- Index ----------------
+
+def find_resource_files(top: str = ".") -> List[str]:
+    """
+    List all the XML files in the 'resources*' directories.
+
+    :param top: Directory containing the resource directories.
+    :return: Sorted list of relative file paths.
+    """
+    files = []
+    for entry in os.listdir(top):
+        if entry.startswith(english_dir) and os.path.isdir(os.path.join(top, entry)):
+            for dirpath, _dirs, names in os.walk(os.path.join(top, entry)):
+                files.extend(os.path.join(dirpath, n) for n in names if n.endswith(".xml"))
+    return sorted(os.path.relpath(f, top) for f in files)
+
+def load_index(path: str = index_file) -> Dict[str, Dict]:
+    """
+    Load the index of previously scanned files, or an empty index if it is
+    missing, unreadable or from another version of this script.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != index_version:
+        return {}
+    return data.get("files", {})
+
+def save_index(index: Dict[str, Dict], path: str = index_file) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": index_version, "files": index}, f, ensure_ascii=False)
+
+def scan_files(
+    files: List[str],
+    index: Optional[Dict[str, Dict]] = None,
+    jobs: Optional[int] = None,
+) -> Tuple[Dict[str, Dict], int]:
+    """
+    Scan the files in parallel, reusing the facts in the index for any file whose
+    modification time and size are unchanged. The index is updated in place.
+
+    :param files: Paths of the XML files to scan.
+    :param index: Index from a previous run, see load_index().
+    :param jobs: Number of worker threads, defaults to the executor's choice.
+    :return: Tuple of (dictionary of path to facts, number of files parsed).
+    """
+    if index is None:
+        index = {}
+    facts: Dict[str, Dict] = {}
+    stale: List[Tuple[str, List[int]]] = []
+    for f in files:
+        st = os.stat(f)
+        key = [st.st_mtime_ns, st.st_size]
+        entry = index.get(f)
+        if entry and entry.get("key") == key:
+            facts[f] = entry["facts"]
+        else:
+            stale.append((f, key))
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for (f, key), result in zip(stale, pool.map(scan_xml, [f for f, _k in stale])):
+                facts[f] = result
+                index[f] = {"key": key, "facts": result}
+
+    # Forget files that no longer exist, keeping any scanned for another script
+    for f in [f for f in index if not os.path.exists(f)]:
+        del index[f]
+    return facts, len(stale)
+
+# ---------------- Checks ----------------
+
+def check_strings(facts: Dict[str, Dict]) -> List[str]:
+    """
+    Check each language's strings against the English source.
+    """
+    problems = []
+    english_path = os.path.join(english_dir, "strings", "strings.xml")
+    english = facts.get(english_path)
+    if english is None or english["error"]:
+        return problems
+    english_ids = set(english["strings"])
+
+    for path, fact in sorted(facts.items()):
+        if fact["error"] or os.path.basename(os.path.dirname(path)) != "strings":
+            continue
+        ids = set(fact["strings"])
+        for sid in sorted(set(fact["duplicates"])):
+            problems.append(f"{path}: duplicate string id '{sid}'")
+        if path == english_path:
+            continue
+        for sid in sorted(ids - english_ids):
+            problems.append(f"{path}: string id '{sid}' is not in {english_path}")
+        if os.path.basename(path) == "strings.xml":
+            for sid in sorted(english_ids - ids):
+                problems.append(f"{path}: missing string id '{sid}'")
+        for sid in sorted(ids & english_ids):
+            scope = english["scopes"].get(sid)
+            # Corrections are copied into the English XML by translate.py, so
+            # their scope only matters if it has been given.
+            if sid not in fact["scopes"] and os.path.basename(path) == "corrections.xml":
+                continue
+            if fact["scopes"].get(sid) != scope:
+                problems.append(
+                    f"{path}: string id '{sid}' has scope '{fact['scopes'].get(sid)}', expected '{scope}'"
+                )
+    return problems
+
+def check_references(facts: Dict[str, Dict], manifest_refs: List[str]) -> List[str]:
+    """
+    Check '@Strings' references resolve to an English string.
+    """
+    problems = []
+    english = facts.get(os.path.join(english_dir, "strings", "strings.xml"))
+    if english is None or english["error"]:
+        return problems
+    for path, fact in sorted(facts.items()):
+        for ref in fact["refs"]:
+            if ref not in english["strings"]:
+                problems.append(f"{path}: reference to unknown string '@Strings.{ref}'")
+    for ref in manifest_refs:
+        if ref not in english["strings"]:
+            problems.append(f"{manifest_file}: reference to unknown string '@Strings.{ref}'")
+    return problems
+
+def check_drawables(facts: Dict[str, Dict]) -> List[str]:
+    """
+    Check drawables refer to existing files, and that generated icon directories
+    define the same drawables as the directory they were generated from.
+    """
+    problems = []
+    for path, fact in sorted(facts.items()):
+        if fact["error"]:
+            continue
+        for bid, filename in sorted(fact["bitmaps"].items()):
+            if not filename:
+                problems.append(f"{path}: bitmap '{bid}' has no filename")
+            elif not os.path.exists(os.path.join(os.path.dirname(path), filename)):
+                problems.append(f"{path}: bitmap '{bid}' refers to missing file '{filename}'")
+        for prefix, source in icon_sources.items():
+            source_fact = facts.get(os.path.join(source, "drawables.xml"))
+            if not path.startswith(prefix) or source_fact is None or source_fact["error"]:
+                continue
+            expected = set(source_fact["bitmaps"])
+            for bid in sorted(expected - set(fact["bitmaps"])):
+                problems.append(f"{path}: missing drawable '{bid}' defined in {source}")
+            for bid in sorted(set(fact["bitmaps"]) - expected):
+                problems.append(f"{path}: drawable '{bid}' is not defined in {source}")
+    return problems
+
+def check_build_files(
+    products: List[str],
+    languages: List[str],
+    jungle: Dict[str, List[str]],
+) -> List[str]:
+    """
+    Check 'monkey.jungle' and 'manifest.xml' against each other and the file system.
+    """
+    problems = []
+    base = os.path.dirname(os.path.abspath(jungle_file))
+    for product, paths in sorted(jungle.items()):
+        if product not in products:
+            problems.append(f"{jungle_file}: resourcePath for product '{product}' not in {manifest_file}")
+        for p in paths:
+            if not os.path.isdir(os.path.join(base, p)):
+                problems.append(f"{jungle_file}: resourcePath for '{product}' refers to missing directory '{p}'")
+    for product in products:
+        if product not in jungle:
+            problems.append(f"{manifest_file}: product '{product}' has no resourcePath in {jungle_file}")
+    for lang in languages:
+        # English is the default language held in 'resources'
+        if lang == "eng":
+            continue
+        if not os.path.isfile(os.path.join(f"{english_dir}-{lang}", "strings", "strings.xml")):
+            problems.append(f"{manifest_file}: language '{lang}' has no {english_dir}-{lang}/strings/strings.xml")
+    return problems
+
+def lint(jobs: Optional[int] = None, use_cache: bool = True, verbose: bool = False) -> List[str]:
+    """
+    Run all the checks from the current directory.
+
+    :param jobs: Number of worker threads used to parse XML files.
+    :param use_cache: Reuse and update the index of previously parsed files.
+    :param verbose: Print the number of files parsed.
+    :return: List of problems found, empty if the resources are OK.
+    """
+    problems = []
+    try:
+        products, languages = read_manifest()
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest_refs = sorted(set(re.findall(r"@Strings\.(\w+)", f.read())))
+    except (ET.ParseError, OSError) as e:
+        problems.append(f"{manifest_file}: {e}")
+        products, languages, manifest_refs = [], [], []
+    try:
+        jungle = read_jungle()
+    except OSError as e:
+        problems.append(f"{jungle_file}: {e}")
+        jungle = {}
+
+    index = load_index() if use_cache else {}
+    files = find_resource_files()
+    facts, parsed = scan_files(files, index, jobs)
+    if use_cache:
+        save_index(index)
+    if verbose:
+        print(f"Parsed {parsed} of {len(files)} resource files.")
+
+    for path, fact in sorted(facts.items()):
+        if fact["error"]:
+            problems.append(f"{path}: {fact['error']}")
+    problems += check_strings(facts)
+    problems += check_references(facts, manifest_refs)
+    problems += check_drawables(facts)
+    if products:
+        problems += check_build_files(products, languages, jungle)
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the Garmin IQ resources before compiling.")
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker threads used to parse XML files"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Parse every file and do not read or write {index_file}"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Report how many files were parsed rather than taken from the index"
+    )
+    args = parser.parse_args()
+
+    # Paths are relative to this script's directory, as for the other scripts
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    problems = lint(jobs=args.jobs, use_cache=not args.no_cache, verbose=args.verbose)
+    for p in problems:
+        print(p)
+    if problems:
+        print(f"{len(problems)} problem(s) found.")
+        sys.exit(1)
+    print("No problems found.")
+
+if __name__ == "__main__":
+    main()
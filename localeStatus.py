@@ -0,0 +1,205 @@
+####################################################################################
+#
+# Distributed under MIT Licence
+#   See https://github.com/house-of-abbey/GarminHomeAssistant/blob/main/LICENSE
+#
+####################################################################################
+#
+# GarminHomeAssistant is a Garmin IQ application written in Monkey C and routinely
+# tested on a Venu 2 device. The source code is provided at:
+#            https://github.com/house-of-abbey/GarminHomeAssistant
+#
+# J D Abbey & P A Abbey, 19 October 2026
+#
+#
+# Description:
+#
+# Python script to report the state of every translation against the English
+# 'resources/strings/strings.xml' in one pass. For each language the JSON output
+# lists:
+#  * missing      - English string IDs with no translation,
+#  * untranslated - missing string IDs not covered by corrections or exceptions,
+#  * orphaned     - translated string IDs no longer in the English source,
+#  * corrected    - string IDs overridden by 'corrections.xml',
+#  * exceptions   - string IDs always kept in English,
+#  * stale        - corrected or exception string IDs whose text in 'strings.xml'
+#                   differs from what translate.py would write,
+#  * the size in bytes of 'strings.xml' and 'corrections.xml',
+#  * needs_work   - true if translate.py has strings to translate for the language,
+#                   i.e. there are untranslated string IDs.
+#
+# Orphaned and stale string IDs do not need work by this definition, as
+# translate.py skips a language with nothing to translate without rewriting its
+# 'strings.xml'. They are only rewritten by 'translate.py --improve'.
+#
+# The XML files are parsed in parallel and share the index kept by
+# lintResources.py, so unchanged files are not parsed again.
+#
+# Usage:
+#   python localeStatus.py [-o FILE] [--needs-work]
+#
+# The output can be used to limit translate.py to the languages needing work:
+#   python localeStatus.py -o status.json
+#   python translate.py --status status.json
+#
+# Python installation:
+#   No additional packages required.
+#
+####################################################################################
+
+import os
+import sys
+import json
+import argparse
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional
+
+from lintResources import read_manifest, find_resource_files, load_index, save_index, scan_files, english_dir
+
+# ---------------- Configuration ----------------
+
+# Must match 'exceptionIds' in translate.py
+exception_ids: List[str] = ["AppName", "AppVersionTitle"]
+
+english_path = os.path.join(english_dir, "strings", "strings.xml")
+
+# ---------------- Report ----------------
+
+def normalise(text: str) -> str:
+    # Translations are re-wrapped when written, so ignore differences in whitespace
+    return " ".join(text.split())
+
+def file_size(path: str) -> int:
+    return os.path.getsize(path) if os.path.isfile(path) else 0
+
+def language_codes(top: str = ".") -> List[str]:
+    """
+    List the languages from 'manifest.xml' and any 'resources-XXX/strings' directories.
+
+    :return: Sorted list of Garmin three-letter language codes.
+    """
+    codes = set()
+    for entry in os.listdir(top):
+        if entry.startswith(english_dir + "-") and os.path.isdir(os.path.join(top, entry, "strings")):
+            codes.add(entry[len(english_dir) + 1:])
+    try:
+        _products, languages = read_manifest()
+        codes.update(languages)
+    except (ET.ParseError, OSError):
+        pass
+    # English is the default language held in 'resources'
+    codes.discard("eng")
+    return sorted(codes)
+
+def locale_status(
+    code: str,
+    english: Dict[str, str],
+    facts: Dict[str, Dict],
+) -> Dict:
+    """
+    Compare one language with the English strings.
+
+    :param code: Garmin three-letter language code.
+    :param english: English string ID to text.
+    :param facts: Facts for the scanned files, see lintResources.scan_files().
+    :return: Dictionary describing the language's status.
+    """
+    strings_path     = os.path.join(f"{english_dir}-{code}", "strings", "strings.xml")
+    corrections_path = os.path.join(f"{english_dir}-{code}", "strings", "corrections.xml")
+    empty = {"error": None, "strings": {}}
+    strings     = facts.get(strings_path, empty)
+    corrections = facts.get(corrections_path, empty)
+    translated  = strings["strings"]
+
+    exceptions = sorted(sid for sid in exception_ids if sid in english)
+    corrected  = sorted(sid for sid in corrections["strings"] if sid in english and sid not in exception_ids)
+    expected   = {sid: english[sid] for sid in exceptions}
+    expected.update({sid: corrections["strings"][sid] for sid in corrected})
+    stale = sorted(
+        sid for sid, text in expected.items()
+        if sid in translated and normalise(translated[sid]) != normalise(text)
+    )
+    missing = sorted(set(english) - set(translated))
+    status = {
+        "exists"           : os.path.isfile(strings_path),
+        "errors"           : [e for e in [strings["error"], corrections["error"]] if e],
+        "missing"          : missing,
+        "untranslated"     : [sid for sid in missing if sid not in expected],
+        "orphaned"         : sorted(set(translated) - set(english)),
+        "corrected"        : corrected,
+        "exceptions"       : exceptions,
+        "stale"            : stale,
+        "strings_bytes"    : file_size(strings_path),
+        "corrections_bytes": file_size(corrections_path),
+    }
+    # As translate_language() in translate.py decides what to send for translation
+    status["needs_work"] = bool(status["untranslated"])
+    return status
+
+def status_matrix(jobs: Optional[int] = None, use_cache: bool = True) -> Dict:
+    """
+    Build the status of every language from the current directory.
+
+    :param jobs: Number of worker threads used to parse XML files.
+    :param use_cache: Reuse and update the index of previously parsed files.
+    :return: Dictionary with the English string count and the status per language.
+    """
+    index = load_index() if use_cache else {}
+    files = [
+        f for f in find_resource_files()
+        if f == english_path or os.path.basename(os.path.dirname(f)) == "strings"
+    ]
+    facts, _parsed = scan_files(files, index, jobs)
+    if use_cache:
+        save_index(index)
+    english_facts = facts.get(english_path)
+    if english_facts is None or english_facts["error"]:
+        raise RuntimeError(f"Cannot read {english_path}: {english_facts and english_facts['error']}")
+    english = english_facts["strings"]
+    return {
+        "english"  : {"strings": len(english), "strings_bytes": file_size(english_path)},
+        "languages": {code: locale_status(code, english, facts) for code in language_codes()},
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the status of each translation of strings.xml.")
+    parser.add_argument(
+        "-o", "--output",
+        type=str,
+        default=None,
+        help="Write the JSON status matrix to this file instead of standard output"
+    )
+    parser.add_argument(
+        "--needs-work",
+        action="store_true",
+        help="Only print the codes of the languages needing work, space separated and empty if none"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker threads used to parse XML files"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse every file and do not read or write the lintResources.py index"
+    )
+    args = parser.parse_args()
+
+    # Paths are relative to this script's directory, as for the other scripts
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    matrix = status_matrix(jobs=args.jobs, use_cache=not args.no_cache)
+
+    if args.needs_work:
+        print(" ".join(code for code, s in matrix["languages"].items() if s["needs_work"]))
+        return
+    text = json.dumps(matrix, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,495 @@
+####################################################################################
+#
+# Distributed under MIT Licence
+#   See https://github.com/house-of-abbey/GarminHomeAssistant/blob/main/LICENSE
+#
+####################################################################################
+#
+# GarminHomeAssistant is a Garmin IQ application written in Monkey C and routinely
+# tested on a Venu 2 device. The source code is provided at:
+#            https://github.com/house-of-abbey/GarminHomeAssistant
+#
+# J D Abbey & P A Abbey, 19 October 2026
+#
+#
+# Description:
+#
+# Python script to estimate the size of the HTTP requests the application makes
+# for a menu JSON file, and of their responses, and to flag the devices that are
+# likely to fail them with 'NETWORK_RESPONSE_OUT_OF_MEMORY' without the need for
+# a test watch. The request shapes mirror the Monkey C source:
+#  * menu     - HomeAssistantApp.fetchMenuConfig(), GET of the menu JSON itself,
+#  * poll     - HomeAssistantApp.updateMenuItems(), the 'render_template' webhook,
+#  * glance   - HomeAssistantApp.fetchGlanceContent(), the glance's
+#               'render_template' webhook for an 'info' glance,
+#  * action   - HomeAssistantService.call() and
+#               HomeAssistantToggleMenuItem.setState(), one per actionable menu
+#               item,
+#  * webhook  - WebhookManager.requestWebhookId(),
+#  * sensor   - WebhookManager.registerWebhookSensors(), one per sensor.
+#
+# Request sizes are exact for the JSON body. Response sizes are estimates, as they
+# depend on the Home Assistant instance; the figures used can be changed with the
+# options below. Only the menu items the watch creates are included, e.g. a 'tap'
+# item needs an action and an 'info' item needs content, as in HomeAssistantView.
+#
+# The devices are the products in 'manifest.xml'. Their memory limits are read
+# from the Connect IQ SDK device files ('Devices/<product>/compiler.json'), or from
+# a JSON file of product to either bytes for the application type in 'manifest.xml'
+# or a dictionary of 'compiler.json' application type to bytes. The glance request
+# is checked against the 'glance' limit and all others against the application
+# type's limit. A response is flagged for a device when its size multiplied by the
+# expansion factor, to allow for the Monkey C objects built by parsing the JSON,
+# exceeds the free memory left when the application considers itself to be low on
+# memory, i.e. (1 - scLowMem) of the memory limit, as in Globals.mc.
+#
+# Usage:
+#   python profileRequests.py <menu.json> [--devices DIR | --memory FILE] [--json]
+#
+# Python installation:
+#   No additional packages required.
+#
+# References:
+#  * https://developers.home-assistant.io/docs/api/native-app-integration/sending-data/
+#  * https://developers.home-assistant.io/docs/api/native-app-integration/sensors/
+#  * https://developers.home-assistant.io/docs/api/rest/
+#
+####################################################################################
+
+import os
+import sys
+import json
+import argparse
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple
+
+from lintResources import read_manifest, manifest_file, iq_ns
+
+# ---------------- Configuration ----------------
+
+# Globals.scLowMem, the fraction of total memory used at which the application
+# considers itself to be low on memory.
+low_mem = 0.85
+
+# Connect IQ application type in 'manifest.xml' to the SDK's 'compiler.json' name
+app_types: Dict[str, str] = {
+    "watch-app": "watchApp",
+    "widget"   : "widget",
+}
+
+# Estimated response sizes in bytes
+default_state_bytes    = 600 # One entity's state object returned by a '/services/' call
+default_rendered_bytes = 24  # One rendered template value, including its key
+default_expansion      = 4   # Monkey C memory used per byte of JSON response
+
+# WebhookManager.requestWebhookId() response, as documented by Home Assistant
+webhook_response = {
+    "cloudhook_url": "https://hooks.nabu.casa/" + "x" * 150,
+    "remote_ui_url": "https://" + "x" * 32 + ".ui.nabu.casa",
+    "secret"       : None,
+    "webhook_id"   : "x" * 64,
+}
+
+# ---------------- Request shapes ----------------
+
+def compact(obj) -> int:
+    """
+    Size in bytes of an object serialised as compact JSON, as sent by the watch.
+    """
+    return len(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+def entity_count(data: Optional[Dict]) -> int:
+    # Home Assistant returns the states changed by an action, at least one per target entity
+    if not data or "entity_id" not in data:
+        return 1
+    ids = data["entity_id"]
+    return len(ids) if isinstance(ids, list) else 1
+
+def menu_item(item) -> Optional[Dict]:
+    """
+    Resolve a menu item definition as HomeAssistantView and
+    HomeAssistantMenuItemFactory do, assuming a touch screen device.
+
+    :return: Dictionary with the item's 'type', 'content', 'entity', 'action',
+             'data' and 'picker', or None if the watch does not create the item.
+    """
+    if not isinstance(item, dict) or not item.get("type") or not item.get("name"):
+        return None
+    if item.get("enabled", True) is False:
+        return None
+    kind       = item["type"]
+    content    = item.get("content")
+    entity     = item.get("entity")
+    tap_action = item.get("tap_action")
+    action     = item.get("service")
+    data       = None
+    if tap_action is not None:
+        action = tap_action.get("service")
+        if tap_action.get("action") is not None:
+            action = tap_action["action"]
+        data = tap_action.get("data")
+    picker = (tap_action or {}).get("picker")
+
+    if kind == "toggle":
+        if entity is None:
+            return None
+        action, data = entity.split(".", 1)[0] + ".turn_on", {"entity_id": entity}
+    elif kind == "tap":
+        if action is None:
+            return None
+    elif kind in ("template", "info"):
+        if content is None:
+            return None
+    elif kind == "numeric":
+        # Only created on touch screen devices, and only with a picker
+        if action is None or picker is None:
+            return None
+    elif kind != "group":
+        return None
+    if kind in ("tap", "template", "info", "numeric") and entity is not None:
+        data = dict(data or {}, entity_id=entity)
+    return {
+        "type"   : kind,
+        "content": content,
+        "entity" : entity,
+        "action" : action,
+        "data"   : data,
+        "picker" : picker,
+    }
+
+def walk_items(items: List, path: str = "") -> List[Tuple[str, Dict]]:
+    """
+    Flatten the menu items the watch creates in the order HomeAssistantView visits
+    them, see menu_item().
+
+    :return: List of (path of item names, resolved item).
+    """
+    out = []
+    for item in items or []:
+        resolved = menu_item(item)
+        if resolved is None:
+            continue
+        name = f"{path}/{item['name']}"
+        out.append((name, resolved))
+        if resolved["type"] == "group":
+            out.extend(walk_items(item.get("items"), name))
+    return out
+
+def action_request(item: Dict) -> Optional[Tuple[str, Dict]]:
+    """
+    Build the action call for a resolved menu item, as HomeAssistantTapMenuItem,
+    HomeAssistantNumericMenuItem and HomeAssistantToggleMenuItem do.
+
+    :return: Tuple of (action, JSON body), or None if the item has no action.
+    """
+    if item["type"] == "group" or item["action"] is None:
+        return None
+    data = dict(item["data"] or {})
+    if item["type"] == "numeric":
+        picker = item["picker"]
+        if picker.get("data_attribute") is None or data.get("entity_id") is None:
+            return None
+        # The largest value the picker can send
+        data[picker["data_attribute"]] = picker.get("max", 0)
+    return item["action"], data
+
+def poll_templates(items: List[Tuple[str, Dict]]) -> Dict[str, Dict[str, str]]:
+    """
+    Build the 'data' of the 'render_template' webhook as updateMenuItems() does
+    from HomeAssistantView.getItemsToUpdate(), for resolved menu items.
+    """
+    templates: Dict[str, Dict[str, str]] = {}
+    i = 0
+    for _name, item in items:
+        kind    = item["type"]
+        content = item["content"]
+        # Numeric and toggle items are always updated, the others only with a template
+        if kind not in ("numeric", "toggle") and content is None:
+            continue
+        if content is not None:
+            templates[str(i)] = {"template": content}
+        if kind == "toggle":
+            templates[f"{i}t"] = {"template": "{{states('" + item["entity"] + "')}}"}
+        if kind == "numeric":
+            entity = (item["data"] or {}).get("entity_id")
+            template = None
+            if entity is not None:
+                if item["picker"].get("attribute") is None:
+                    template = "{{states('" + entity + "')}}"
+                else:
+                    template = "{{state_attr('" + entity + "','" + item["picker"]["attribute"] + "')}}"
+            templates[f"{i}n"] = {"template": template}
+        i += 1
+    return templates
+
+def sensors() -> List[Dict]:
+    """
+    The sensors registered by WebhookManager.registerWebhookSensors(), with
+    representative states.
+    """
+    common = {"disabled": False}
+    return [
+        dict(common, device_class="battery", name="Battery Level", state=100, type="sensor",
+             unique_id="battery_level", icon="mdi:battery", unit_of_measurement="%",
+             state_class="measurement", entity_category="diagnostic"),
+        dict(common, device_class="battery_charging", name="Battery is Charging", state=False,
+             type="binary_sensor", unique_id="battery_is_charging", icon="mdi:battery-minus",
+             entity_category="diagnostic"),
+        dict(common, name="Heart rate", state=100, type="sensor", unique_id="heart_rate",
+             icon="mdi:heart-pulse", unit_of_measurement="bpm", state_class="measurement"),
+        dict(common, name="Steps today", state=10000, type="sensor", unique_id="steps_today",
+             icon="mdi:walk", state_class="total"),
+        dict(common, name="Floors climbed today", state=100, type="sensor",
+             unique_id="floors_climbed_today", icon="mdi:stairs-up", state_class="total"),
+        dict(common, name="Floors descended today", state=100, type="sensor",
+             unique_id="floors_descended_today", icon="mdi:stairs-down", state_class="total"),
+        dict(common, name="Respiration rate", state=20, type="sensor", unique_id="respiration_rate",
+             icon="mdi:lungs", unit_of_measurement="bpm", state_class="measurement"),
+        dict(common, name="Activity", state=-1, type="sensor", unique_id="activity"),
+        dict(common, name="Sub-activity", state=-1, type="sensor", unique_id="sub_activity"),
+    ]
+
+def profile(
+    menu_text: str,
+    state_bytes: int = default_state_bytes,
+    rendered_bytes: int = default_rendered_bytes,
+    app_type: str = "watchApp",
+) -> List[Dict]:
+    """
+    Estimate the request and response sizes for every request a menu causes.
+
+    :param menu_text: The menu JSON as served to the watch.
+    :param state_bytes: Estimated size of one entity state in an action's response.
+    :param rendered_bytes: Estimated size of one rendered template in the poll response.
+    :param app_type: Application type as named in 'compiler.json', for all but the glance.
+    :return: List of dictionaries with 'kind', 'name', 'app', 'request' and 'response'
+             sizes, where 'app' is the application type whose memory limit applies.
+    """
+    menu  = json.loads(menu_text)
+    items = walk_items(menu.get("items"))
+    rows  = [{
+        "kind"    : "menu",
+        "name"    : "Fetch menu",
+        "request" : 0,
+        "response": len(menu_text.encode("utf-8")),
+    }]
+
+    # The glance only renders a template for an 'info' glance, see glanceTemplate()
+    glance = menu.get("glance") or {}
+    if glance.get("type") == "info" and glance.get("content") is not None:
+        rows.append({
+            "kind"    : "glance",
+            "name"    : "Render glance template",
+            "app"     : "glance",
+            "request" : compact({
+                "type": "render_template",
+                "data": {"glanceTemplate": {"template": glance["content"]}},
+            }),
+            "response": compact({"glanceTemplate": "x" * rendered_bytes}),
+        })
+
+    templates = poll_templates(items)
+    if templates:
+        rows.append({
+            "kind"    : "poll",
+            "name"    : f"Render {len(templates)} templates",
+            "request" : compact({"type": "render_template", "data": templates}),
+            "response": 2 + len(templates) * rendered_bytes,
+        })
+
+    for name, item in items:
+        req = action_request(item)
+        if req is None:
+            continue
+        action, data = req
+        rows.append({
+            "kind"    : "action",
+            "name"    : f"{name} ({action})",
+            "request" : compact(data),
+            "response": 2 + entity_count(data) * state_bytes,
+        })
+
+    rows.append({
+        "kind"    : "webhook",
+        "name"    : "Request webhook ID",
+        "request" : compact({
+            "device_id": "x" * 40, "app_id": "garmin_home_assistant", "app_name": "HomeAssistant",
+            "app_version": "", "device_name": "Garmin Device", "manufacturer": "Garmin",
+            "model": "006-B0000-00", "os_name": "", "os_version": "00.00",
+            "supports_encryption": False, "app_data": {},
+        }),
+        "response": compact(webhook_response),
+    })
+    for s in sensors():
+        rows.append({
+            "kind"    : "sensor",
+            "name"    : f"Register '{s['unique_id']}'",
+            "request" : compact({"type": "register_sensor", "data": s}),
+            "response": compact({"success": True}),
+        })
+    for r in rows:
+        r.setdefault("app", app_type)
+    return rows
+
+# ---------------- Device memory ----------------
+
+def default_devices_dir() -> str:
+    for base in [
+        os.path.expanduser(os.path.join("~", ".Garmin", "ConnectIQ")),
+        os.path.join(os.environ.get("APPDATA", ""), "Garmin", "ConnectIQ"),
+    ]:
+        if os.path.isdir(os.path.join(base, "Devices")):
+            return os.path.join(base, "Devices")
+    return ""
+
+def read_app_type(path: str = manifest_file) -> str:
+    app = ET.parse(path).getroot().find("iq:application", iq_ns)
+    return app_types.get(app.get("type") if app is not None else "", "watchApp")
+
+def device_memory(
+    products: List[str],
+    app_type: str,
+    devices_dir: str = "",
+    memory_file: str = "",
+) -> Dict[str, Dict[str, int]]:
+    """
+    Find each product's memory limits per application type.
+
+    :param products: Product IDs from 'manifest.xml'.
+    :param app_type: Application type as named in 'compiler.json', used for
+                     memory file entries given as a single number of bytes.
+    :param devices_dir: Connect IQ SDK 'Devices' directory.
+    :param memory_file: JSON file of product ID to memory limit in bytes, or to a
+                        dictionary of application type to bytes, used in
+                        preference to the SDK device files.
+    :return: Dictionary of product to application type to bytes, omitting
+             products with no data.
+    """
+    memory: Dict[str, Dict[str, int]] = {}
+    if memory_file:
+        with open(memory_file, "r", encoding="utf-8") as f:
+            limits = json.load(f)
+        for p in products:
+            if isinstance(limits.get(p), dict):
+                memory[p] = {t: int(b) for t, b in limits[p].items()}
+            elif p in limits:
+                memory[p] = {app_type: int(limits[p])}
+        return memory
+
+    for p in products:
+        path = os.path.join(devices_dir, p, "compiler.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                compiler = json.load(f)
+        except (OSError, ValueError):
+            continue
+        limits = {
+            t["type"]: int(t["memoryLimit"])
+            for t in compiler.get("appTypes", [])
+            if t.get("type") and t.get("memoryLimit")
+        }
+        if limits:
+            memory[p] = limits
+    return memory
+
+def failures(rows: List[Dict], memory: Dict[str, Dict[str, int]], expansion: float) -> List[Dict]:
+    """
+    Find the devices where each request's response is likely to run out of memory,
+    checked against the memory limit of the request's application type. Devices
+    with no limit for that type, e.g. no glance support, are not checked.
+
+    Each row gains a 'failing' list of devices, as names need not be unique.
+
+    :return: List of the rows failing on at least one device, in the order of 'rows'.
+    """
+    for r in rows:
+        needed = r["response"] * expansion
+        r["failing"] = [
+            p for p, limits in memory.items()
+            if r["app"] in limits and needed > (1 - low_mem) * limits[r["app"]]
+        ]
+    return [r for r in rows if r["failing"]]
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate request and response sizes for a menu, and the devices likely to run out of memory.")
+    parser.add_argument("menu", type=str, help="Menu JSON file, as served from the configuration URL")
+    parser.add_argument(
+        "--devices",
+        type=str,
+        default=None,
+        help="Connect IQ SDK 'Devices' directory with a compiler.json per product (default: the SDK manager's)"
+    )
+    parser.add_argument(
+        "--memory",
+        type=str,
+        default=None,
+        help="JSON file of product ID to memory limit in bytes, or to a dictionary of compiler.json "
+             "application type (e.g. 'watchApp', 'glance') to bytes, instead of the SDK device files"
+    )
+    parser.add_argument(
+        "--state-bytes",
+        type=int,
+        default=default_state_bytes,
+        help=f"Estimated bytes per entity state in an action's response (default {default_state_bytes})"
+    )
+    parser.add_argument(
+        "--rendered-bytes",
+        type=int,
+        default=default_rendered_bytes,
+        help=f"Estimated bytes per rendered template in the poll response (default {default_rendered_bytes})"
+    )
+    parser.add_argument(
+        "--expansion",
+        type=float,
+        default=default_expansion,
+        help=f"Monkey C memory used per byte of JSON response (default {default_expansion})"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the results as JSON"
+    )
+    args = parser.parse_args()
+
+    with open(args.menu, "r", encoding="utf-8") as f:
+        menu_text = f.read()
+    # Resolve the user's paths before changing directory
+    devices_dir = os.path.abspath(args.devices) if args.devices is not None else default_devices_dir()
+    memory_file = os.path.abspath(args.memory) if args.memory else ""
+
+    # 'manifest.xml' is relative to this script's directory, as for the other scripts
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    products, _languages = read_manifest()
+    app_type = read_app_type()
+    rows = profile(menu_text, args.state_bytes, args.rendered_bytes, app_type)
+    try:
+        memory = device_memory(products, app_type, devices_dir, memory_file)
+    except (OSError, ValueError) as e:
+        print(f"Cannot read memory limits from {memory_file}: {e}")
+        sys.exit(1)
+    failing = failures(rows, memory, args.expansion)
+
+    if args.json:
+        print(json.dumps({
+            "requests": rows,
+            "failures": [{"name": r["name"], "devices": r["failing"]} for r in failing],
+            "no_memory_data": [p for p in products if p not in memory],
+        }, indent=2))
+        return
+
+    width = max(len(r["name"]) for r in rows)
+    print(f"{'Kind':8} {'Request':{width}} {'Sent':>8} {'Received':>8}  Memory limit")
+    for r in rows:
+        print(f"{r['kind']:8} {r['name']:{width}} {r['request']:>8} {r['response']:>8}  {r['app']}")
+    print()
+    if len(memory) < len(products):
+        print(f"No memory data for {len(products) - len(memory)} of {len(products)} devices.")
+    for r in failing:
+        print(f"{r['name']}: likely out of memory on {len(r['failing'])} device(s): {', '.join(r['failing'])}")
+    if not failing and memory:
+        print("No requests likely to run out of memory.")
+    if failing:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
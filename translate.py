@@ -27,6 +27,10 @@
 # To get your own API key, go to:
 # https://aistudio.google.com/app/apikey
 #
+# To only translate the languages that need work, see localeStatus.py:
+#   python localeStatus.py -o status.json
+#   python translate.py --status status.json
+#
 ####################################################################################
 
 import os
@@ -87,6 +91,7 @@ languages: List[Tuple[str, str, str]] = [
     ("vie", "vi", "Vietnamese"),
 ]
 
+# Must match 'exception_ids' in localeStatus.py
 exceptionIds: List[str] = ["AppName", "AppVersionTitle"]
 
 # ---------------- Helpers ----------------
@@ -267,6 +272,34 @@ def select_languages_from_arg(spec: str, verbose: bool = False) -> List[Tuple[st
     selected = [trip for trip in languages if trip[0].lower() in selected_codes]
     return selected
 
+def load_status(path: str) -> Dict[str, Dict]:
+    """
+    Load the per-language status from a JSON status matrix written by localeStatus.py.
+
+    Raises OSError if the file cannot be read, or ValueError if it is not a
+    status matrix.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    status = data.get("languages") if isinstance(data, dict) else None
+    if not isinstance(status, dict) or not all(isinstance(v, dict) for v in status.values()):
+        raise ValueError("not a status matrix written by localeStatus.py")
+    return status
+
+def select_languages_from_status(
+    status: Dict[str, Dict],
+    candidates: List[Tuple[str, str, str]],
+) -> List[Tuple[str, str, str]]:
+    """
+    Limit the candidate languages to those marked as needing work in the status
+    matrix, see load_status(). Languages absent from the matrix are kept, as
+    their status is unknown.
+    """
+    return [
+        trip for trip in candidates
+        if status.get(trip[0], {}).get("needs_work", True)
+    ]
+
 # ---------------- Main translation logic ----------------
 
 def translate_language(
@@ -447,7 +480,24 @@ def main():
         help="Limit processed languages. Accepts comma/space separated Garmin codes (e.g., 'deu, fre'), "
              "2-letter codes (e.g., 'de fr'), or names (e.g., 'German French'). Use '*' or 'all' for all."
     )
+    parser.add_argument(
+        "-s", "--status",
+        type=str,
+        default=None,
+        help="Limit processed languages to those with untranslated strings in a JSON status matrix written by "
+             "localeStatus.py. Combines with --langs. Not allowed with --improve, which reprocesses languages "
+             "with no untranslated strings too."
+    )
     args = parser.parse_args()
+    if args.status and args.improve:
+        parser.error("--status cannot be used with --improve; use --langs to select languages to improve")
+    # Check the status file before creating the client
+    status = None
+    if args.status:
+        try:
+            status = load_status(args.status)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot read --status file '{args.status}': {e}")
 
     # Init client
     client = genai.Client()
@@ -464,6 +514,8 @@ def main():
 
     # Determine which languages to process
     selected_languages = select_languages_from_arg(args.langs, verbose=args.verbose)
+    if status is not None:
+        selected_languages = select_languages_from_status(status, selected_languages)
     if not selected_languages:
         print("No valid languages selected. Nothing to do.")
         sys.exit(0)